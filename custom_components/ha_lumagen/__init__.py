@@ -1,8 +1,16 @@
 """The Lumagen integration."""
 from __future__ import annotations
 
+import array
+import asyncio
+import fcntl
 import logging
+import os
+from pathlib import Path
+import sys
+import termios
 
+from lumagen.constants import ConnectionStatus, EventType
 from lumagen.device_manager import DeviceManager
 
 from homeassistant.config_entries import ConfigEntry
@@ -14,25 +22,99 @@ from .const import (
     CONF_CONNECTION_TYPE,
     CONNECTION_TYPE_IP,
     CONNECTION_TYPE_SERIAL,
+    CONNECT_TIMEOUT,
+    DATA_PENDING_DEVICES,
     DEFAULT_BAUDRATE,
     DEFAULT_PORT,
     DOMAIN,
 )
 from .coordinator import LumagenCoordinator
+from .util import log_exception, unregister_listener
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SELECT, Platform.SWITCH, Platform.REMOTE]
 
+# serial_struct flag that disables the USB serial latency timer
+ASYNC_LOW_LATENCY = 0x2000
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Lumagen from a config entry."""
-    _LOGGER.info("Setting up Lumagen integration for entry %s", entry.entry_id)
+
+def _enable_serial_low_latency(port: str) -> None:
+    """Put a Linux serial port into low latency mode.
+    
+    USB serial adapters hold short reads for up to 16ms by default, which
+    delays every status frame from the device. Runs in the executor.
+    """
+    try:
+        fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            # Same serial_struct handling as pyserial's set_low_latency_mode
+            buf = array.array("i", [0] * 32)
+            fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+            buf[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        finally:
+            os.close(fd)
+        _LOGGER.debug("Enabled low latency mode on %s", port)
+        return
+    except OSError as err:
+        _LOGGER.debug("Could not set ASYNC_LOW_LATENCY on %s: %s", port, err)
+    
+    # Fall back to the USB serial driver's latency timer
+    latency_timer = Path(
+        "/sys/bus/usb-serial/devices", Path(port).resolve().name, "latency_timer"
+    )
+    try:
+        latency_timer.write_text("1")
+        _LOGGER.debug("Set USB serial latency timer to 1ms for %s", port)
+    except OSError as err:
+        _LOGGER.debug("Could not set latency timer for %s: %s", port, err)
+
+
+async def _async_close_unused(device_manager: DeviceManager) -> None:
+    """Close a connection that setup will not use, so it stops reconnecting."""
+    try:
+        await device_manager.close()
+    except Exception as err:
+        _LOGGER.debug("Error closing unused connection: %s", err)
+
+
+def _claim_pending_device_manager(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> DeviceManager | None:
+    """Take over the connection validated by the config flow, if any."""
+    pending = hass.data.get(DOMAIN, {}).get(DATA_PENDING_DEVICES, {})
+    claimed = pending.pop(entry.unique_id, None)
+    if claimed is None:
+        return None
+    
+    device_manager, cancel_release = claimed
+    cancel_release()
     
-    # Initialize device manager
+    if not device_manager.is_connected:
+        _LOGGER.debug("Connection from config flow was lost, reconnecting")
+        hass.async_create_task(_async_close_unused(device_manager))
+        return None
+    
+    _LOGGER.debug("Reusing connection established by the config flow")
+    return device_manager
+
+
+async def _async_connect(entry: ConfigEntry) -> DeviceManager:
+    """Open a new connection to the device and wait until it is ready."""
     connection_type = entry.data.get(CONF_CONNECTION_TYPE, CONNECTION_TYPE_IP)
     device_manager = DeviceManager(connection_type=connection_type, reconnect=True)
     
+    # Signal readiness from the dispatcher instead of sleeping a fixed time
+    connected = asyncio.Event()
+
+    def _on_connection_state(_, event_data: dict) -> None:
+        if event_data.get("state") == ConnectionStatus.CONNECTED:
+            connected.set()
+
+    dispatcher = device_manager.dispatcher
+    dispatcher.register_listener(EventType.CONNECTION_STATE, _on_connection_state)
+
     # Open connection based on type
     try:
         if connection_type == CONNECTION_TYPE_IP:
@@ -46,29 +128,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.debug("Opening serial connection to %s at %s baud", port, baudrate)
             await device_manager.open(port=port, baudrate=baudrate)
         
-        # Wait for connection to be established
-        import asyncio
-        await asyncio.sleep(2)
-        
+        # Wait for connection to be established, unless open() already did
         if not device_manager.is_connected:
-            _LOGGER.error("Device connection not established after initial setup")
-            raise ConfigEntryNotReady("Device connection not established")
+            try:
+                await asyncio.wait_for(connected.wait(), timeout=CONNECT_TIMEOUT)
+            except TimeoutError as err:
+                _LOGGER.error("Device connection not established after initial setup")
+                raise ConfigEntryNotReady("Device connection not established") from err
         
         _LOGGER.info("Successfully connected to Lumagen device")
             
     except ConfigEntryNotReady:
+        await _async_close_unused(device_manager)
         raise
     except Exception as err:
-        _LOGGER.error("Failed to connect to Lumagen device: %s", err, exc_info=True)
+        log_exception(_LOGGER, "Failed to connect to Lumagen device: %s", err)
+        await _async_close_unused(device_manager)
         raise ConfigEntryNotReady(f"Failed to connect: {err}") from err
+    finally:
+        unregister_listener(dispatcher, EventType.CONNECTION_STATE, _on_connection_state)
+    
+    return device_manager
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Lumagen from a config entry."""
+    _LOGGER.info("Setting up Lumagen integration for entry %s", entry.entry_id)
+    
+    # Reuse the config flow's connection when the entry was just created
+    device_manager = _claim_pending_device_manager(hass, entry)
+    if device_manager is None:
+        device_manager = await _async_connect(entry)
+    
+    if (
+        entry.data.get(CONF_CONNECTION_TYPE) == CONNECTION_TYPE_SERIAL
+        and sys.platform == "linux"
+    ):
+        await hass.async_add_executor_job(
+            _enable_serial_low_latency, entry.data[CONF_PORT]
+        )
     
     # Create coordinator
     _LOGGER.debug("Creating data coordinator")
     coordinator = LumagenCoordinator(hass, entry, device_manager)
     
-    # Fetch initial data
-    _LOGGER.debug("Fetching initial device data")
-    await coordinator.async_config_entry_first_refresh()
+    # Seed initial data; everything after this arrives through events
+    _LOGGER.debug("Seeding initial device data")
+    coordinator.seed_initial_data()
     
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
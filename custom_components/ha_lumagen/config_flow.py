@@ -6,66 +6,82 @@ import logging
 from typing import Any
 
 import voluptuous as vol
+from lumagen.constants import ConnectionStatus, EventType
 from lumagen.device_manager import DeviceManager
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
+    ALIVE_TIMEOUT,
+    CONF_COMMAND_DELAY,
     CONF_CONNECTION_TYPE,
     CONNECTION_TYPE_IP,
     CONNECTION_TYPE_SERIAL,
+    DATA_PENDING_DEVICES,
     DEFAULT_BAUDRATE,
+    DEFAULT_COMMAND_DELAY,
     DEFAULT_PORT,
     DOMAIN,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_CONFIG,
     ERROR_UNKNOWN,
+    PENDING_DEVICE_TIMEOUT,
 )
+from .util import log_exception, unregister_listener
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validators and selectors shared by the schemas below
+_CONNECTION_TYPE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(
+                value=CONNECTION_TYPE_IP,
+                label="IP Connection (Network)",
+            ),
+            selector.SelectOptionDict(
+                value=CONNECTION_TYPE_SERIAL,
+                label="Serial Connection (RS232)",
+            ),
+        ],
+        mode=selector.SelectSelectorMode.LIST,
+    )
+)
+_PORT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))
+_BAUD_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.In([9600, 19200, 38400, 57600, 115200])
+)
+_COMMAND_DELAY_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0, max=1))
+
 # Subtask 2.1: Connection type selection schema
 STEP_CONNECTION_TYPE_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_CONNECTION_TYPE): selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(
-                        value=CONNECTION_TYPE_IP,
-                        label="IP Connection (Network)",
-                    ),
-                    selector.SelectOptionDict(
-                        value=CONNECTION_TYPE_SERIAL,
-                        label="Serial Connection (RS232)",
-                    ),
-                ],
-                mode=selector.SelectSelectorMode.LIST,
-            )
-        ),
-    }
+        vol.Required(CONF_CONNECTION_TYPE): _CONNECTION_TYPE_SELECTOR,
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 # Subtask 2.2: IP connection configuration schema
 STEP_IP_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
-        vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(
-            vol.Coerce(int), vol.Range(min=1, max=65535)
-        ),
-    }
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): _PORT_VALIDATOR,
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 # Subtask 2.3: Serial connection configuration schema
 STEP_SERIAL_DATA_SCHEMA = vol.Schema(
     {
         vol.Required("port"): str,
-        vol.Required("baudrate", default=DEFAULT_BAUDRATE): vol.All(
-            vol.Coerce(int), vol.In([9600, 19200, 38400, 57600, 115200])
-        ),
-    }
+        vol.Required("baudrate", default=DEFAULT_BAUDRATE): _BAUD_VALIDATOR,
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 
@@ -78,6 +94,15 @@ class LumagenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._connection_type: str | None = None
         self._config_data: dict[str, Any] = {}
+        self._device_manager: DeviceManager | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> LumagenOptionsFlow:
+        """Get the options flow for this handler."""
+        return LumagenOptionsFlow(config_entry)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -114,15 +139,16 @@ class LumagenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_PORT: user_input[CONF_PORT],
             }
             
+            # Create unique ID based on connection info
+            await self.async_set_unique_id(
+                f"{user_input[CONF_HOST]}_{user_input[CONF_PORT]}"
+            )
+            self._abort_if_unique_id_configured()
+            
             # Subtask 2.4: Test connection
             result = await self._test_connection()
             if result is True:
-                # Create unique ID based on connection info
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_HOST]}_{user_input[CONF_PORT]}"
-                )
-                self._abort_if_unique_id_configured()
-                
+                self._stash_device_manager()
                 return self.async_create_entry(
                     title=f"Lumagen ({user_input[CONF_HOST]})",
                     data=self._config_data,
@@ -150,15 +176,16 @@ class LumagenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "baudrate": user_input["baudrate"],
             }
             
+            # Create unique ID based on connection info
+            await self.async_set_unique_id(
+                f"{user_input['port']}_{user_input['baudrate']}"
+            )
+            self._abort_if_unique_id_configured()
+            
             # Subtask 2.4: Test connection
             result = await self._test_connection()
             if result is True:
-                # Create unique ID based on connection info
-                await self.async_set_unique_id(
-                    f"{user_input['port']}_{user_input['baudrate']}"
-                )
-                self._abort_if_unique_id_configured()
-                
+                self._stash_device_manager()
                 return self.async_create_entry(
                     title=f"Lumagen ({user_input['port']})",
                     data=self._config_data,
@@ -175,19 +202,36 @@ class LumagenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _test_connection(self) -> str | bool:
         """Test connection to Lumagen device.
         
+        On success the open connection is kept in ``self._device_manager``.
+        
         Returns:
             True if connection successful, error string otherwise.
         """
         device = None
         connection_type = self._config_data[CONF_CONNECTION_TYPE]
+        # Set once the device answers its alive check or the connection drops
+        settled = asyncio.Event()
+
+        def _on_alive(_, event_data: dict) -> None:
+            if event_data.get("value"):
+                settled.set()
+
+        def _on_connection_state(_, event_data: dict) -> None:
+            if event_data.get("state") != ConnectionStatus.CONNECTED:
+                settled.set()
         
         try:
             _LOGGER.debug("Testing %s connection to Lumagen device", connection_type)
             
-            # Create DeviceManager with reconnect disabled for testing
+            # Create DeviceManager with reconnect enabled, since a successful
+            # connection is handed over to async_setup_entry
             device = DeviceManager(
                 connection_type=connection_type,
-                reconnect=False,
+                reconnect=True,
+            )
+            device.dispatcher.register_listener("is_alive", _on_alive)
+            device.dispatcher.register_listener(
+                EventType.CONNECTION_STATE, _on_connection_state
             )
             
             # Attempt to open connection based on type
@@ -202,10 +246,14 @@ class LumagenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.debug("Attempting serial connection to %s at %s baud", port, baudrate)
                 await device.open(port=port, baudrate=baudrate)
             
-            # Wait for device to respond and complete alive check
-            # Give extra time for the alive check to complete
-            _LOGGER.debug("Waiting for device to respond...")
-            await asyncio.sleep(5)
+            # Wait for device to respond and complete alive check; a failed
+            # or dropped connection ends the wait early
+            if not device.is_alive:
+                _LOGGER.debug("Waiting for device to respond...")
+                try:
+                    await asyncio.wait_for(settled.wait(), timeout=ALIVE_TIMEOUT)
+                except TimeoutError:
+                    _LOGGER.debug("Timed out waiting for alive check")
             
             # Check if connection is established and device is alive
             if not device.is_connected:
@@ -227,17 +275,80 @@ class LumagenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # The alive check may complete after initial setup
             
             _LOGGER.info("Successfully validated connection to Lumagen device")
+            self._device_manager = device
             return True
             
         except Exception as err:
-            _LOGGER.error("Error testing connection: %s", err, exc_info=True)
+            log_exception(_LOGGER, "Error testing connection: %s", err)
             return ERROR_CANNOT_CONNECT
             
         finally:
-            # Always close the test connection
             if device is not None:
+                unregister_listener(device.dispatcher, "is_alive", _on_alive)
+                unregister_listener(
+                    device.dispatcher, EventType.CONNECTION_STATE, _on_connection_state
+                )
+            # Close the test connection unless it is kept for setup
+            if device is not None and device is not self._device_manager:
                 try:
                     _LOGGER.debug("Closing test connection")
                     await device.close()
                 except Exception as err:
                     _LOGGER.debug("Error closing test connection: %s", err)
+
+    def _stash_device_manager(self) -> None:
+        """Hand the validated connection over to async_setup_entry.
+        
+        The connection is closed if no config entry claims it in time.
+        """
+        device = self._device_manager
+        unique_id = self.unique_id
+        pending = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+            DATA_PENDING_DEVICES, {}
+        )
+
+        async def _async_release(_now) -> None:
+            claimed = pending.get(unique_id)
+            if claimed is None or claimed[0] is not device:
+                return
+            del pending[unique_id]
+            _LOGGER.debug("Closing unclaimed connection for %s", unique_id)
+            try:
+                await device.close()
+            except Exception as err:
+                _LOGGER.debug("Error closing unclaimed connection: %s", err)
+
+        pending[unique_id] = (
+            device,
+            async_call_later(self.hass, PENDING_DEVICE_TIMEOUT, _async_release),
+        )
+        self._device_manager = None
+
+
+class LumagenOptionsFlow(config_entries.OptionsFlow):
+    """Handle Lumagen options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_COMMAND_DELAY,
+                        default=self._entry.options.get(
+                            CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY
+                        ),
+                    ): _COMMAND_DELAY_VALIDATOR,
+                }
+            ),
+        )
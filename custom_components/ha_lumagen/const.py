@@ -7,10 +7,24 @@ DOMAIN = "ha_lumagen"
 DEFAULT_PORT = 4999
 DEFAULT_BAUDRATE = 9600
 
+# Seconds to wait for the device to report it is ready after opening
+CONNECT_TIMEOUT = 10
+# Seconds the config flow waits for the device to answer its alive check
+ALIVE_TIMEOUT = 5
+
+# Connections validated by the config flow, handed over to async_setup_entry
+DATA_PENDING_DEVICES = "pending_devices"
+# Seconds before an unclaimed config flow connection is closed
+PENDING_DEVICE_TIMEOUT = 30
+
 # Pure event-driven architecture - no polling
 # All updates come from pylumagen dispatcher events
 # No DEFAULT_SCAN_INTERVAL needed
 
+# Options
+CONF_COMMAND_DELAY = "command_delay"
+DEFAULT_COMMAND_DELAY = 0.0
+
 # Connection types
 CONF_CONNECTION_TYPE = "connection_type"
 CONNECTION_TYPE_IP = "ip"
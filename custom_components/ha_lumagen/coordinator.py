@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import timedelta
+from functools import partial
 import logging
 from typing import Any
 
@@ -13,17 +14,15 @@ from lumagen.device_manager import DeviceManager
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import (
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
+from .util import log_exception, unregister_listener
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LumagenData:
     """Data structure for Lumagen device state."""
 
@@ -31,11 +30,32 @@ class LumagenData:
     is_connected: bool
     is_alive: bool
     device_status: DeviceStatus
+    # Attribute events covered by this snapshot; None means anything may
+    # have changed (connection, power state, setup)
+    changed: frozenset[str] | None = None
+
+    def affects(self, events: tuple[str, ...] | None) -> bool:
+        """Return whether this snapshot may change values fed by events.
+        
+        events of None means the value does not map to specific events.
+        """
+        return self.changed is None or events is None or not self.changed.isdisjoint(events)
 
 
 class LumagenCoordinator(DataUpdateCoordinator[LumagenData]):
     """Coordinator for Lumagen device with pure event-driven updates."""
 
+    # Device attributes whose change events trigger a data update
+    _EVENT_ATTRS = (
+        "input_labels",
+        "physical_input_selected",
+        "current_source_content_aspect",
+        "detected_source_aspect",
+        "source_mode",
+        "source_vertical_rate",
+        "source_dynamic_range",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -51,133 +71,173 @@ class LumagenCoordinator(DataUpdateCoordinator[LumagenData]):
         )
         self.device_manager = device_manager
         self.entry = entry
-        self._event_listeners = []  # Track registered listeners for cleanup
+        # Device registry identifiers shared by all entities of this entry
+        self.device_identifiers = frozenset({(DOMAIN, entry.entry_id)})
+        # Coalesce bursts of events into a single update
+        self._flush_handle: asyncio.Handle | None = None
+        self._flush_immediate = False
+        self._changed_events: set[str] = set()
+        self._update_debounce = 0.05
+        # Set once the device answers its alive check on the current connection
+        self._alive_event = asyncio.Event()
+        # Seconds to let the device settle after power on before querying it
+        self._power_on_settle = 0.5
         self._setup_event_listeners()
 
     def _setup_event_listeners(self) -> None:
         """Subscribe to device state change events."""
-        dispatcher = self.device_manager.dispatcher
+        register = self.device_manager.dispatcher.register_listener
         
         # Subscribe to all relevant state changes
-        # Track each listener for cleanup
+        # All handlers run synchronously on the event loop; slow work such as
+        # device queries is split off into background tasks
         # Use dedicated handler for device_status to handle power-on refresh
-        power_handler = lambda _, ed: asyncio.create_task(self._handle_power_state_change(_, ed))
-        dispatcher.register_listener("device_status", power_handler)
-        self._event_listeners.append(("device_status", power_handler))
-        
-        input_labels_handler = self._create_event_handler("input_labels")
-        dispatcher.register_listener("input_labels", input_labels_handler)
-        self._event_listeners.append(("input_labels", input_labels_handler))
-        
-        physical_input_handler = self._create_event_handler("physical_input_selected")
-        dispatcher.register_listener("physical_input_selected", physical_input_handler)
-        self._event_listeners.append(("physical_input_selected", physical_input_handler))
-        
-        content_aspect_handler = self._create_event_handler("current_source_content_aspect")
-        dispatcher.register_listener("current_source_content_aspect", content_aspect_handler)
-        self._event_listeners.append(("current_source_content_aspect", content_aspect_handler))
-        
-        detected_aspect_handler = self._create_event_handler("detected_source_aspect")
-        dispatcher.register_listener("detected_source_aspect", detected_aspect_handler)
-        self._event_listeners.append(("detected_source_aspect", detected_aspect_handler))
+        listeners = [("device_status", self._handle_power_state_change)]
+        # Attribute events share one handler; it only schedules an update
+        listeners.extend(
+            (attr_name, partial(self._dispatch, attr_name))
+            for attr_name in self._EVENT_ATTRS
+        )
+        listeners.append(("is_alive", self._handle_alive_state))
+        listeners.append((EventType.CONNECTION_STATE, self._handle_connection_state))
         
-        source_mode_handler = self._create_event_handler("source_mode")
-        dispatcher.register_listener("source_mode", source_mode_handler)
-        self._event_listeners.append(("source_mode", source_mode_handler))
+        # Unregister each listener when the config entry unloads, passing the
+        # same callable object that was registered
+        for event_type, handler in listeners:
+            register(event_type, handler)
+            self.entry.async_on_unload(partial(self._unregister, event_type, handler))
         
-        vertical_rate_handler = self._create_event_handler("source_vertical_rate")
-        dispatcher.register_listener("source_vertical_rate", vertical_rate_handler)
-        self._event_listeners.append(("source_vertical_rate", vertical_rate_handler))
+        _LOGGER.debug("Event listeners registered for pure event-driven updates")
+
+    def _unregister(self, event_type: str, handler: Callable[..., Any]) -> None:
+        """Unregister a listener; errors must not abort the entry unload."""
+        unregister_listener(self.device_manager.dispatcher, event_type, handler)
+
+    def _dispatch(self, attr_name: str, _sender, event_data: dict) -> None:
+        """Forward a dispatcher callback for attr_name to the shared handler."""
+        self._generic_handler(attr_name, event_data)
+
+    def _generic_handler(self, attr_name: str, event_data: dict) -> None:
+        """Handle device attribute change events."""
+        _LOGGER.debug("Received event: %s = %s", attr_name, event_data.get("value"))
         
-        dynamic_range_handler = self._create_event_handler("source_dynamic_range")
-        dispatcher.register_listener("source_dynamic_range", dynamic_range_handler)
-        self._event_listeners.append(("source_dynamic_range", dynamic_range_handler))
+        # Schedule a debounced update so a burst notifies entities once
+        self._changed_events.add(attr_name)
+        self._schedule_flush()
+
+    def _handle_alive_state(self, _, event_data: dict) -> None:
+        """Handle alive check results."""
+        if event_data.get("value"):
+            self._alive_event.set()
+        self._generic_handler("is_alive", event_data)
+
+    def _schedule_flush(self, *, immediate: bool = False) -> None:
+        """Schedule one coalesced update for all pending device events.
         
-        is_alive_handler = self._create_event_handler("is_alive")
-        dispatcher.register_listener("is_alive", is_alive_handler)
-        self._event_listeners.append(("is_alive", is_alive_handler))
+        Attribute events wait out a short debounce window. State changes
+        flush on the next loop iteration and absorb a pending debounce.
+        """
+        handle = self._flush_handle
+        if handle is not None:
+            if not immediate or self._flush_immediate:
+                return
+            handle.cancel()
         
-        dispatcher.register_listener(EventType.CONNECTION_STATE, self._handle_connection_state)
-        self._event_listeners.append((EventType.CONNECTION_STATE, self._handle_connection_state))
+        if immediate:
+            self._flush_handle = self.hass.loop.call_soon(self._flush_update)
+        else:
+            self._flush_handle = self.hass.loop.call_later(
+                self._update_debounce, self._flush_update
+            )
+        self._flush_immediate = immediate
+
+    def _flush_update(self) -> None:
+        """Push the current device state to all entities."""
+        self._flush_handle = None
         
-        _LOGGER.debug("Event listeners registered for pure event-driven updates")
+        # Attribute-only flushes tell entities which events they cover
+        changed = None if self._flush_immediate else frozenset(self._changed_events)
+        self._changed_events.clear()
+        self.async_set_updated_data(self._snapshot(changed))
 
-    def _create_event_handler(self, attr_name: str):
-        """Create an event handler for a specific attribute."""
-        async def handler(event_data: dict):
-            await self._on_device_event(attr_name, event_data)
-        return lambda _, ed: asyncio.create_task(handler(ed))
-
-    async def _on_device_event(self, attr_name: str, event_data: dict) -> None:
-        """Handle device state change event."""
-        value = event_data.get("value")
-        _LOGGER.debug("Received event: %s = %s", attr_name, value)
-        
-        # Update coordinator data immediately
-        new_data = LumagenData(
-            device_info=self.device_manager.device_info,
-            is_connected=self.device_manager.is_connected,
-            is_alive=self.device_manager.is_alive,
-            device_status=self.device_manager.device_status,
+    def _snapshot(self, changed: frozenset[str] | None = None) -> LumagenData:
+        """Return an immutable snapshot of the current device state."""
+        device_manager = self.device_manager
+        return LumagenData(
+            device_info=device_manager.device_info,
+            is_connected=device_manager.is_connected,
+            is_alive=device_manager.is_alive,
+            device_status=device_manager.device_status,
+            changed=changed,
         )
-        
-        # Notify all entities of the update
-        self.async_set_updated_data(new_data)
 
-    async def _handle_power_state_change(self, _, event_data: dict) -> None:
+    def _handle_power_state_change(self, _, event_data: dict) -> None:
         """Handle power state changes."""
         new_status = event_data.get("value")
         old_status = self.data.device_status if self.data else None
         
         _LOGGER.debug("Power state changed: %s -> %s", old_status, new_status)
         
-        # If transitioning from Standby to Active, schedule a full refresh
+        # If transitioning from Standby to Active, schedule a refresh
         if old_status == DeviceStatus.STANDBY and new_status == DeviceStatus.ACTIVE:
-            _LOGGER.info("Device powered on, scheduling full refresh in 5 seconds")
-            asyncio.create_task(self._delayed_refresh_on_power_on())
-        
-        # Update coordinator data immediately
-        new_data = LumagenData(
-            device_info=self.device_manager.device_info,
-            is_connected=self.device_manager.is_connected,
-            is_alive=self.device_manager.is_alive,
-            device_status=new_status,
-        )
-        self.async_set_updated_data(new_data)
+            _LOGGER.info("Device powered on, scheduling refresh once it settles")
+            self.entry.async_create_background_task(
+                self.hass,
+                self._delayed_refresh_on_power_on(),
+                "lumagen_power_on_refresh",
+            )
+        
+        # Update coordinator data on the next loop iteration
+        self._schedule_flush(immediate=True)
 
     async def _delayed_refresh_on_power_on(self) -> None:
-        """Refresh all sensor states 5 seconds after power on."""
-        await asyncio.sleep(5)
+        """Refresh the source state once the device has settled after power on."""
+        await asyncio.sleep(self._power_on_settle)
+        if self.device_manager.device_status != DeviceStatus.ACTIVE:
+            _LOGGER.debug("Device left active state, skipping power on refresh")
+            return
+        
         try:
-            _LOGGER.debug("Executing full refresh after power on")
+            _LOGGER.debug("Refreshing source state after power on")
             await self.device_manager.executor.get_all()
-            # get_all triggers events that will update all sensors
         except Exception as err:
             _LOGGER.error("Failed to refresh after power on: %s", err)
 
-    async def _handle_connection_state(self, _, event_data: dict) -> None:
+    def _handle_connection_state(self, _, event_data: dict) -> None:
         """Handle connection state changes."""
         state = event_data.get("state")
         _LOGGER.info("Connection state changed: %s", state)
         
         if state == ConnectionStatus.CONNECTED:
             # Fetch input labels once after connection
-            await asyncio.sleep(1)
-            _LOGGER.debug("Fetching labels after connection...")
-            try:
-                await self.device_manager.executor.get_labels()
-                _LOGGER.debug("Labels fetched successfully")
-            except Exception as err:
-                _LOGGER.error("Error fetching labels: %s", err, exc_info=True)
+            self.entry.async_create_background_task(
+                self.hass, self._async_fetch_labels(), "lumagen_fetch_labels"
+            )
+        else:
+            self._alive_event.clear()
         
         # Update coordinator data
-        new_data = LumagenData(
-            device_info=self.device_manager.device_info,
-            is_connected=self.device_manager.is_connected,
-            is_alive=self.device_manager.is_alive,
-            device_status=self.device_manager.device_status,
-        )
-        self.async_set_updated_data(new_data)
+        self._schedule_flush(immediate=True)
+
+    async def _async_fetch_labels(self) -> None:
+        """Fetch input labels once the device passes its alive check."""
+        # The event is cleared on disconnect, so it only counts alive checks
+        # answered on this connection
+        if not self._alive_event.is_set():
+            try:
+                await asyncio.wait_for(self._alive_event.wait(), timeout=5.0)
+            except TimeoutError:
+                _LOGGER.debug("No alive check after connection, fetching labels anyway")
+        _LOGGER.debug("Fetching labels after connection...")
+        try:
+            await self.device_manager.executor.get_labels()
+            _LOGGER.debug("Labels fetched successfully")
+        except Exception as err:
+            log_exception(_LOGGER, "Error fetching labels: %s", err)
+
+    def seed_initial_data(self) -> None:
+        """Populate data at setup without a refresh or listener broadcast."""
+        self.data = self._snapshot()
 
     async def _async_update_data(self) -> LumagenData:
         """
@@ -186,41 +246,15 @@ class LumagenCoordinator(DataUpdateCoordinator[LumagenData]):
         This method is required by DataUpdateCoordinator but not used
         since update_interval is None. All updates come from events.
         """
-        return LumagenData(
-            device_info=self.device_manager.device_info,
-            is_connected=self.device_manager.is_connected,
-            is_alive=self.device_manager.is_alive,
-            device_status=self.device_manager.device_status,
-        )
-
-    def _cleanup_event_listeners(self) -> None:
-        """Unregister all event listeners."""
-        if not self.device_manager or not hasattr(self.device_manager, 'dispatcher'):
-            return
-        
-        dispatcher = self.device_manager.dispatcher
-        
-        # Check if dispatcher has unregister method
-        if not hasattr(dispatcher, 'unregister_listener'):
-            _LOGGER.debug("Dispatcher does not support unregister_listener, skipping cleanup")
-            return
-        
-        _LOGGER.debug("Unregistering %d event listeners", len(self._event_listeners))
-        for event_type, handler in self._event_listeners:
-            try:
-                dispatcher.unregister_listener(event_type, handler)
-            except Exception as err:
-                _LOGGER.debug("Error unregistering listener for %s: %s", event_type, err)
-        
-        self._event_listeners.clear()
-        _LOGGER.debug("Event listeners cleanup completed")
+        return self._snapshot()
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator and close device connection."""
         _LOGGER.info("Shutting down Lumagen coordinator")
         
-        # Clean up event listeners first
-        self._cleanup_event_listeners()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         
         if self.device_manager:
             try:
@@ -228,4 +262,4 @@ class LumagenCoordinator(DataUpdateCoordinator[LumagenData]):
                 await self.device_manager.close()
                 _LOGGER.info("Device connection closed successfully")
             except Exception as err:
-                _LOGGER.error("Error closing device connection: %s", err, exc_info=True)
+                log_exception(_LOGGER, "Error closing device connection: %s", err)
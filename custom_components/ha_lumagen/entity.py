@@ -0,0 +1,59 @@
+"""Base entity for the Lumagen integration."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import LumagenCoordinator
+from .util import build_device_info
+
+
+class LumagenEntity(CoordinatorEntity[LumagenCoordinator]):
+    """Base class for Lumagen entities."""
+
+    _attr_has_entity_name = True
+    # Dispatcher events that can change this entity's state; None updates
+    # on every event, () only on connection and power state changes
+    _relevant_events: tuple[str, ...] | None = None
+    # Command keys mapped to executor method names, see _executor_command
+    _command_map: Mapping[str, str] = {}
+
+    def __init__(self, coordinator: LumagenCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        # Home Assistant only reads device info when the entity is added
+        self._attr_device_info = build_device_info(
+            coordinator.device_identifiers, coordinator.data.device_info
+        )
+        # Bound executor methods by command key, resolved on first use and
+        # dropped when the device manager replaces its executor
+        self._commands: dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._commands_executor: Any = None
+
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Skip the state write when none of this entity's events changed
+        if not self.coordinator.data.affects(self._relevant_events):
+            return
+        super()._handle_coordinator_update()
+
+    def _executor_command(self, key: str) -> Callable[[], Awaitable[Any]] | None:
+        """Return the executor method for a command key, or None if unknown.
+        
+        Raises AttributeError if the executor lacks the mapped method.
+        """
+        executor = self.coordinator.device_manager.executor
+        if executor is not self._commands_executor:
+            self._commands_executor = executor
+            self._commands.clear()
+        
+        method = self._commands.get(key)
+        if method is None:
+            method_name = self._command_map.get(key)
+            if method_name is None:
+                return None
+            method = getattr(executor, method_name)
+            self._commands[key] = method
+        return method
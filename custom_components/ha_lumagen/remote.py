@@ -12,10 +12,10 @@ from homeassistant.components.remote import RemoteEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY, DOMAIN
 from .coordinator import LumagenCoordinator
+from .entity import LumagenEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,31 +64,20 @@ async def async_setup_entry(
     async_add_entities([LumagenRemoteEntity(coordinator)])
 
 
-class LumagenRemoteEntity(CoordinatorEntity[LumagenCoordinator], RemoteEntity):
+class LumagenRemoteEntity(LumagenEntity, RemoteEntity):
     """Remote entity for Lumagen device menu navigation."""
 
-    _attr_has_entity_name = True
     _attr_name = "Remote"
     _attr_icon = "mdi:remote"
+    # Remote state only depends on connection and power state
+    _relevant_events = ()
+    _command_map = COMMAND_MAP
 
     def __init__(self, coordinator: LumagenCoordinator) -> None:
         """Initialize the remote entity."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_remote"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this Lumagen device."""
-        device_info = self.coordinator.data.device_info
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": f"Lumagen {device_info.model_name if device_info else 'RadiancePro'}",
-            "manufacturer": "Lumagen",
-            "model": device_info.model_name if device_info else "RadiancePro",
-            "sw_version": device_info.software_revision if device_info else None,
-            "serial_number": device_info.serial_number if device_info else None,
-        }
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -133,19 +122,20 @@ class LumagenRemoteEntity(CoordinatorEntity[LumagenCoordinator], RemoteEntity):
             command_list = list(command)
             _LOGGER.debug("Sending %d remote command(s): %s", len(command_list), command_list)
             
-            for cmd in command_list:
-                cmd_lower = cmd.lower()
-                if cmd_lower in COMMAND_MAP:
-                    method_name = COMMAND_MAP[cmd_lower]
-                    method = getattr(
-                        self.coordinator.device_manager.executor, method_name
-                    )
-                    _LOGGER.debug("Executing remote command: %s", cmd_lower)
-                    await method()
-                    # Small delay between commands
-                    await asyncio.sleep(0.1)
-                else:
+            delay = self.coordinator.entry.options.get(
+                CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY
+            )
+            last_index = len(command_list) - 1
+            for index, cmd in enumerate(command_list):
+                method = self._executor_command(cmd.lower())
+                if method is None:
                     _LOGGER.warning("Unknown remote command: %s (ignored)", cmd)
+                    continue
+                _LOGGER.debug("Executing remote command: %s", cmd)
+                await method()
+                # Optional delay between commands, none after the last one
+                if delay and index != last_index:
+                    await asyncio.sleep(delay)
             
             _LOGGER.info("Successfully sent %d remote command(s)", len(command_list))
 
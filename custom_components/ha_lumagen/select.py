@@ -1,7 +1,7 @@
 """Select platform for Lumagen integration."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 import logging
 from typing import Any
@@ -12,10 +12,10 @@ from homeassistant.components.select import SelectEntity, SelectEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LumagenCoordinator, LumagenData
+from .entity import LumagenEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,9 +25,14 @@ class LumagenSelectEntityDescription(SelectEntityDescription):
     """Describes Lumagen select entity."""
 
     current_option_fn: Callable[[LumagenData], str | None]
-    select_option_fn: Callable[[LumagenCoordinator, str], Any]
+    # Either a function that applies the option, or a map from option to
+    # the executor method that selects it
+    select_option_fn: Callable[[LumagenCoordinator, str], Any] | None = None
+    command_map: Mapping[str, str] | None = None
     options_fn: Callable[[LumagenCoordinator], list[str]] | None = None
     static_options: list[str] | None = None
+    # Dispatcher events that can change the option; None updates on every event
+    relevant_events: tuple[str, ...] | None = None
 
 
 # Aspect ratio mapping to pylumagen methods
@@ -44,6 +49,17 @@ ASPECT_RATIO_MAP = {
     "NLS": "nls",
 }
 
+# Input source options used until the device reports its labels
+_DEFAULT_INPUT_SOURCES = tuple(f"Input {i}" for i in range(8))
+
+# Memory bank mapping to pylumagen methods
+MEMORY_BANK_MAP = {
+    "A": "mema",
+    "B": "memb",
+    "C": "memc",
+    "D": "memd",
+}
+
 
 async def _select_input_source(coordinator: LumagenCoordinator, option: str) -> None:
     """Select input source."""
@@ -63,51 +79,17 @@ async def _select_input_source(coordinator: LumagenCoordinator, option: str) ->
     await coordinator.device_manager.executor.input(input_index)
 
 
-async def _select_aspect_ratio(coordinator: LumagenCoordinator, option: str) -> None:
-    """Select source aspect ratio."""
-    method_name = ASPECT_RATIO_MAP.get(option)
-    if method_name is None:
-        _LOGGER.error("Unknown aspect ratio: %s", option)
-        return
-    
-    _LOGGER.debug("Setting aspect ratio to %s using method %s", option, method_name)
-    # Get the method directly from executor and call it
-    method = getattr(coordinator.device_manager.executor, method_name)
-    await method()
-
-
-async def _select_input_config(coordinator: LumagenCoordinator, option: str) -> None:
-    """Select memory bank (A, B, C, D)."""
-    # Map option to memory bank method
-    memory_methods = {
-        "A": coordinator.device_manager.executor.mema,
-        "B": coordinator.device_manager.executor.memb,
-        "C": coordinator.device_manager.executor.memc,
-        "D": coordinator.device_manager.executor.memd,
-    }
-    
-    method = memory_methods.get(option)
-    if method is None:
-        _LOGGER.error("Unknown memory bank: %s", option)
-        return
-    
-    _LOGGER.debug("Recalling memory bank %s", option)
-    await method()
-
-
 def _get_input_source_options(coordinator: LumagenCoordinator) -> list[str]:
     """Get input source options from device."""
     try:
         source_list = coordinator.device_manager.source_list
         # Ensure we have a valid list
-        if source_list and isinstance(source_list, list) and len(source_list) > 0:
+        if isinstance(source_list, list) and source_list:
             return source_list
-        # Return default input numbers if source list not available
-        return [f"Input {i}" for i in range(8)]
     except Exception as err:
         _LOGGER.error("Error getting source list: %s", err)
-        # Return default input numbers as fallback
-        return [f"Input {i}" for i in range(8)]
+    # Return default input numbers if source list not available
+    return list(_DEFAULT_INPUT_SOURCES)
 
 
 def _get_current_input_source(data: LumagenData) -> str | None:
@@ -133,15 +115,16 @@ SELECT_ENTITIES: tuple[LumagenSelectEntityDescription, ...] = (
         name="Source Aspect Ratio",
         icon="mdi:aspect-ratio",
         current_option_fn=lambda data: data.device_info.current_source_content_aspect,
-        select_option_fn=_select_aspect_ratio,
+        command_map=ASPECT_RATIO_MAP,
         static_options=["4:3", "16:9", "1.85", "1.90", "2.00", "2.20", "2.35", "2.40", "Letterbox", "NLS"],
+        relevant_events=("current_source_content_aspect",),
     ),
     LumagenSelectEntityDescription(
         key="memory_bank",
         name="Memory Bank",
         icon="mdi:memory",
         current_option_fn=lambda data: data.device_info.input_memory if data.device_info else None,
-        select_option_fn=_select_input_config,
+        command_map=MEMORY_BANK_MAP,
         static_options=["A", "B", "C", "D"],
     ),
 )
@@ -166,11 +149,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class LumagenSelectEntity(CoordinatorEntity[LumagenCoordinator], SelectEntity):
+class LumagenSelectEntity(LumagenEntity, SelectEntity):
     """Base class for Lumagen select entities."""
 
     entity_description: LumagenSelectEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -180,20 +162,13 @@ class LumagenSelectEntity(CoordinatorEntity[LumagenCoordinator], SelectEntity):
         """Initialize the select entity."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._relevant_events = description.relevant_events
+        if description.command_map is not None:
+            self._command_map = description.command_map
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this Lumagen device."""
-        device_info = self.coordinator.data.device_info
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": f"Lumagen {device_info.model_name if device_info else 'RadiancePro'}",
-            "manufacturer": "Lumagen",
-            "model": device_info.model_name if device_info else "RadiancePro",
-            "sw_version": device_info.software_revision if device_info else None,
-            "serial_number": device_info.serial_number if device_info else None,
-        }
+        # Dynamic options, recomputed once per coordinator snapshot
+        self._options_data: LumagenData | None = None
+        self._options_cache: list[str] = []
 
     @property
     def options(self) -> list[str]:
@@ -203,7 +178,11 @@ class LumagenSelectEntity(CoordinatorEntity[LumagenCoordinator], SelectEntity):
             return self.entity_description.static_options
         # Otherwise get dynamic options from the options function
         elif self.entity_description.options_fn:
-            return self.entity_description.options_fn(self.coordinator)
+            data = self.coordinator.data
+            if data is not self._options_data:
+                self._options_data = data
+                self._options_cache = self.entity_description.options_fn(self.coordinator)
+            return self._options_cache
         return []
 
     @property
@@ -240,7 +219,14 @@ class LumagenSelectEntity(CoordinatorEntity[LumagenCoordinator], SelectEntity):
         """Change the selected option."""
         try:
             _LOGGER.debug("Setting %s to %s", self.entity_description.key, option)
-            await self.entity_description.select_option_fn(self.coordinator, option)
+            if self.entity_description.command_map is not None:
+                method = self._executor_command(option)
+                if method is None:
+                    _LOGGER.error("Unknown %s: %s", self.entity_description.key, option)
+                    return
+                await method()
+            else:
+                await self.entity_description.select_option_fn(self.coordinator, option)
             _LOGGER.info("Successfully set %s to %s", self.entity_description.key, option)
         
         except Exception as err:
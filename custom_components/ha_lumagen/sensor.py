@@ -16,10 +16,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LumagenCoordinator, LumagenData
+from .entity import LumagenEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +29,8 @@ class LumagenSensorEntityDescription(SensorEntityDescription):
     """Describes Lumagen sensor entity."""
 
     value_fn: Callable[[LumagenData], Any]
+    # Dispatcher events that can change the value; None updates on every event
+    relevant_events: tuple[str, ...] | None = None
 
 
 def _format_output_resolution(data: LumagenData) -> str | None:
@@ -56,6 +58,7 @@ STATUS_SENSORS: tuple[LumagenSensorEntityDescription, ...] = (
         name="Physical Input",
         icon="mdi:video-input-component",
         value_fn=lambda data: data.device_info.physical_input if data.device_info else None,
+        relevant_events=("physical_input_selected",),
     ),
     LumagenSensorEntityDescription(
         key="output_resolution",
@@ -68,12 +71,14 @@ STATUS_SENSORS: tuple[LumagenSensorEntityDescription, ...] = (
         name="Source Aspect Ratio",
         icon="mdi:aspect-ratio",
         value_fn=lambda data: data.device_info.current_source_content_aspect if data.device_info else None,
+        relevant_events=("current_source_content_aspect",),
     ),
     LumagenSensorEntityDescription(
         key="source_dynamic_range",
         name="Source Dynamic Range",
         icon="mdi:brightness-7",
         value_fn=lambda data: data.device_info.source_dynamic_range if data.device_info else None,
+        relevant_events=("source_dynamic_range",),
     ),
     LumagenSensorEntityDescription(
         key="input_configuration",
@@ -149,11 +154,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class LumagenSensorEntity(CoordinatorEntity[LumagenCoordinator], SensorEntity):
+class LumagenSensorEntity(LumagenEntity, SensorEntity):
     """Base class for Lumagen sensor entities."""
 
     entity_description: LumagenSensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -163,21 +167,9 @@ class LumagenSensorEntity(CoordinatorEntity[LumagenCoordinator], SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._relevant_events = description.relevant_events
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this Lumagen device."""
-        device_info = self.coordinator.data.device_info
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": f"Lumagen {device_info.model_name if device_info else 'RadiancePro'}",
-            "manufacturer": "Lumagen",
-            "model": device_info.model_name if device_info else "RadiancePro",
-            "sw_version": device_info.software_revision if device_info else None,
-            "serial_number": device_info.serial_number if device_info else None,
-        }
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
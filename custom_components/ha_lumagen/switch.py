@@ -1,7 +1,9 @@
 """Switch platform for Lumagen integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from typing import Any
 
 from lumagen.constants import DeviceStatus
@@ -10,10 +12,10 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LumagenCoordinator
+from .entity import LumagenEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,80 +33,150 @@ async def async_setup_entry(
     async_add_entities([LumagenPowerSwitch(coordinator)])
 
 
-class LumagenPowerSwitch(CoordinatorEntity[LumagenCoordinator], SwitchEntity):
+class LumagenPowerSwitch(LumagenEntity, SwitchEntity):
     """Representation of a Lumagen power switch."""
 
-    _attr_has_entity_name = True
     _attr_name = "Power"
     _attr_icon = "mdi:power"
+    _relevant_events = ()
+    _ACTIVE = DeviceStatus.ACTIVE
+    # Optimistic state: 1 = on, 0 = off, _NO_OPT = follow the device
+    _NO_OPT = -1
+    # Requests arriving within this many seconds of a sent command are
+    # coalesced into the next one
+    _COMMAND_COOLDOWN = 0.25
+
+    # The entity base classes still give instances a __dict__; slots only
+    # speed up access to the attributes below
+    __slots__ = (
+        "_opt",
+        "_data",
+        "_available",
+        "_last_key",
+        "_pending_power",
+        "_power_seq",
+        "_sent_seq",
+        "_power_lock",
+    )
 
     def __init__(self, coordinator: LumagenCoordinator) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_power"
-        self._optimistic_state: bool | None = None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this Lumagen device."""
-        device_info = self.coordinator.data.device_info
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": f"Lumagen {device_info.model_name if device_info else 'RadiancePro'}",
-            "manufacturer": "Lumagen",
-            "model": device_info.model_name if device_info else "RadiancePro",
-            "sw_version": device_info.software_revision if device_info else None,
-            "serial_number": device_info.serial_number if device_info else None,
-        }
+        self._attr_unique_id = sys.intern(f"{coordinator.entry.entry_id}_power")
+        self._opt: int = self._NO_OPT
+        self._data = coordinator.data
+        self._available = coordinator.last_update_success and self._data.is_connected
+        # State last written by a coordinator update, see _handle_coordinator_update
+        self._last_key: tuple | None = None
+        # Coalesce rapid toggles: requests are numbered, and each send covers
+        # every request made before it, so only the latest state goes out
+        self._pending_power: bool | None = None
+        self._power_seq = 0
+        self._sent_seq = 0
+        self._power_lock = asyncio.Lock()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         # Power switch available when connected (even in standby)
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data.is_connected
-        )
+        return self._available
 
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
         # Use optimistic state if set, otherwise use actual state
-        if self._optimistic_state is not None:
-            return self._optimistic_state
-        return self.coordinator.data.device_status == DeviceStatus.ACTIVE
+        if self._opt >= 0:
+            return bool(self._opt)
+        return self._data.device_status == self._ACTIVE
     
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Attribute-only flushes can't change power state; ignoring them keeps
+        # the optimistic state while a command is still going out
+        if not self.coordinator.data.affects(self._relevant_events):
+            return
+        self._data = self.coordinator.data
+        self._available = self.coordinator.last_update_success and self._data.is_connected
+        
+        # Skip the state write if nothing this entity shows has changed
+        key = (self._data.device_status, self._available)
+        if key == self._last_key and self._opt < 0:
+            return
+        self._last_key = key
         # Clear optimistic state once we get an update
-        self._optimistic_state = None
+        self._opt = self._NO_OPT
         super()._handle_coordinator_update()
 
+    async def _apply_power(self, seq: int) -> bool | None:
+        """Send the most recently requested power state to the device.
+        
+        Returns once a command covering request seq has been sent, with the
+        state this call sent, or None if an earlier send already covered it.
+        A failed send is logged and raises; requests still waiting retry on
+        their own.
+        """
+        async with self._power_lock:
+            if self._sent_seq >= seq:
+                return None
+            sending = self._power_seq
+            power = self._pending_power
+            executor = self.coordinator.device_manager.executor
+            try:
+                if power:
+                    await executor.power_on()
+                else:
+                    await executor.standby()
+            except Exception as err:
+                _LOGGER.error(
+                    "Failed to request %s: %s",
+                    "power on" if power else "standby",
+                    err,
+                    exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
+                )
+                raise
+            self._sent_seq = sending
+            # Hold the lock briefly so rapid toggles collapse into one command
+            await asyncio.sleep(self._COMMAND_COOLDOWN)
+            return power
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
-        try:
-            _LOGGER.info("Turning on Lumagen device")
-            await self.coordinator.device_manager.executor.power_on()
-            # Set optimistic state
-            self._optimistic_state = True
-            self.async_write_ha_state()
-            _LOGGER.debug("Power on command sent successfully")
-        except Exception as err:
-            self._optimistic_state = None
-            _LOGGER.error("Failed to turn on device: %s", err, exc_info=True)
-            raise
+        await self._async_set_power(on=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off (standby)."""
-        try:
-            _LOGGER.info("Turning off Lumagen device (standby)")
-            await self.coordinator.device_manager.executor.standby()
-            # Set optimistic state
-            self._optimistic_state = False
-            self.async_write_ha_state()
-            _LOGGER.debug("Standby command sent successfully")
-        except Exception as err:
-            self._optimistic_state = None
-            _LOGGER.error("Failed to turn off device: %s", err, exc_info=True)
-            raise
+        await self._async_set_power(on=False)
+
+    async def _async_set_power(self, *, on: bool) -> None:
+        """Show the requested power state and send it in the background."""
+        action = "power on" if on else "standby"
+        _LOGGER.info("Requesting %s for Lumagen device", action)
+        # Set optimistic state
+        self._pending_power = on
+        self._power_seq += 1
+        self._opt = int(on)
+        self.async_write_ha_state()
+        # Don't hold the service call while the command goes out
+        self.coordinator.entry.async_create_background_task(
+            self.hass,
+            self._async_send_power(self._power_seq),
+            f"lumagen_{action.replace(' ', '_')}",
+        )
 
+    async def _async_send_power(self, seq: int) -> None:
+        """Send the coalesced power command, dropping the optimistic state on failure."""
+        try:
+            power = await self._apply_power(seq)
+        except Exception:
+            # _apply_power logged the failure. A newer request owns the
+            # optimistic state and sends on its own
+            if seq == self._power_seq:
+                self._opt = self._NO_OPT
+                self.async_write_ha_state()
+            return
+        
+        # The device confirms through its device_status event
+        if power is not None and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s command sent successfully", "Power on" if power else "Standby"
+            )
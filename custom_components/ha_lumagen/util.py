@@ -0,0 +1,55 @@
+"""Helpers for the Lumagen integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from lumagen import DeviceInfo as LumagenDeviceInfo
+
+from homeassistant.helpers.device_registry import DeviceInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+_MANUFACTURER = "Lumagen"
+_DEFAULT_MODEL = "RadiancePro"
+
+
+def log_exception(logger: logging.Logger, msg: str, err: Exception) -> None:
+    """Log a routine connection error, with a traceback only when debugging.
+    
+    ``msg`` is a %-style format string taking ``err`` as its only argument.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, err, exc_info=True)
+    else:
+        logger.warning(msg, err)
+
+
+def unregister_listener(
+    dispatcher: Any, event_type: str, handler: Callable[..., Any]
+) -> None:
+    """Unregister a dispatcher listener, logging instead of raising on failure."""
+    unregister = getattr(dispatcher, "unregister_listener", None)
+    if unregister is None:
+        _LOGGER.debug("Dispatcher does not support unregister_listener, skipping cleanup")
+        return
+    try:
+        unregister(event_type, handler)
+    except Exception as err:
+        _LOGGER.debug("Error unregistering listener for %s: %s", event_type, err)
+
+
+def build_device_info(
+    identifiers: frozenset[tuple[str, str]], device_info: LumagenDeviceInfo | None
+) -> DeviceInfo:
+    """Return device information about a Lumagen device."""
+    model = device_info.model_name if device_info else _DEFAULT_MODEL
+    return DeviceInfo(
+        identifiers=identifiers,
+        name=f"Lumagen {model}",
+        manufacturer=_MANUFACTURER,
+        model=model,
+        sw_version=device_info.software_revision if device_info else None,
+        serial_number=device_info.serial_number if device_info else None,
+    )
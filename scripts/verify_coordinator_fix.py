@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Verify that the coordinator has the correct get_labels() call."""
+
+import mmap
+from pathlib import Path
+import re
+
+COORDINATOR = Path(__file__).resolve().parent.parent / 'custom_components' / 'ha_lumagen' / 'coordinator.py'
+
+# Matches both get_labels() and the old get_labels(get_all=...) call;
+# group 1 is set only for the old call
+_GET_LABELS_CALL = re.compile(rb"get_labels\((?:(get_all=)|\))")
+
+
+def check_coordinator():
+    """Check if coordinator.py has the correct get_labels() call."""
+    found_correct = False
+    with open(COORDINATOR, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        # Single pass over the raw bytes for both call forms
+        for match in _GET_LABELS_CALL.finditer(content):
+            if match.group(1):
+                print("❌ FOUND INCORRECT CALL: get_labels(get_all=...)")
+                print("   The code still has the old API call")
+                return False
+            found_correct = True
+    
+    # Check for the correct call
+    if found_correct:
+        print("✅ CORRECT: get_labels() is called without parameters")
+        return True
+    
+    print("⚠️  WARNING: Could not find get_labels() call")
+    return False
+
+if __name__ == '__main__':
+    if check_coordinator():
+        print("\nThe code is correct. Please restart Home Assistant to load the updated code.")
+    else:
+        print("\nThe code needs to be fixed.")